@@ -1,24 +1,146 @@
 #!/usr/bin/env python3
 
+import functools
+import os
 import sys
+import tempfile
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as arrow_csv
+except ImportError:
+    pa = None
+
 from PySide2 import QtCore, QtWidgets, QtGui
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.colors import BoundaryNorm
 from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
 from matplotlib.ticker import MaxNLocator
 
+# Shared background and alignment for every table cell instead of building them per data() call
+WHITE = QtGui.QColor(QtCore.Qt.white)
+ALIGN_RIGHT = int(QtCore.Qt.AlignRight)
+
+# (attribute name, label text) of the line edits in the options column
+PLOT_OPTIONS = (('x_axis_label', 'x axis label'),
+                ('y_axis_label', 'y axis label'),
+                ('axis_label_fontsize', 'axis label fontsize'),
+                ('tickmarks_fontsize', 'tickmarks fontsize'),
+                ('shift_y_values', 'shift y values'),
+                ('multiply_y_values', 'multiply y values'))
+TABLE_OPTIONS = (('centercol', 'Center column'),
+                 ('centerrow', 'Center row'))
+
+
+def parse_data_arrow(fname):
+    """The function that parses single space separated numeric files with pyarrow.
+    Raises ValueError for anything else (runs of spaces, tabs, text fields)
+    """
+    table = arrow_csv.read_csv(fname, read_options=arrow_csv.ReadOptions(autogenerate_column_names=True),
+                               parse_options=arrow_csv.ParseOptions(delimiter=' '))
+    for column in table.columns:
+        if not (pa.types.is_floating(column.type) or pa.types.is_integer(column.type)):
+            raise ValueError('non-numeric column in {}'.format(fname))
+
+    return np.column_stack([column.to_numpy() for column in table.columns]).astype(np.float64)
+
+
+def parse_data(fname):
+    """The function that parses the text file, with pyarrow when it is installed and
+    the pandas C engine otherwise. Any string fields are coerced to NaN and the grid
+    is returned as a 2d float64 numpy array
+    """
+    if pa is not None:
+        try:
+            return parse_data_arrow(fname)
+        except ValueError:
+            # pyarrow.ArrowInvalid is a ValueError too, so the pandas path handles every failure
+            pass
+
+    try:
+        data_frame = pd.read_csv(fname, sep=r'\s+', header=None, engine='c',
+                                 dtype=np.float64, na_filter=False, memory_map=True, comment='#')
+    except ValueError:
+        # Non-numeric fields (e.g. axis titles) fall back to the slower coerce path
+        data_frame = pd.read_csv(fname, sep=r'\s+', header=None, engine='c', memory_map=True, comment='#')
+        data_frame = data_frame.apply(pd.to_numeric, errors='coerce')
+
+    return data_frame.to_numpy(dtype=np.float64)
+
+
+def read_data(fname, rebuild=False):
+    """The function that reads the file chosen in the file dialog.
+    .npy files are memory mapped directly. For text files a parsed copy is kept in a
+    .f64.npy sidecar next to the file and memory mapped from then on, as long as
+    it is newer than the text file. rebuild=True reparses the text regardless.
+    """
+    with open(fname, 'rb') as data_file:
+        if data_file.read(len(np.lib.format.MAGIC_PREFIX)) == np.lib.format.MAGIC_PREFIX:
+            return np.load(fname, mmap_mode='r')
+
+    cache = fname + '.f64.npy'
+    if not rebuild and os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(fname):
+        return np.load(cache, mmap_mode='r')
+
+    data_arr = parse_data(fname)
+    try:
+        # Write to a unique file beside the old sidecar and swap it in,
+        # an array still mapping the old one stays valid
+        cache_fd, cache_tmp = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(cache)))
+    except OSError:
+        # Read-only location, just keep the parsed array in memory
+        return data_arr
+    try:
+        with os.fdopen(cache_fd, 'wb') as cache_file:
+            np.save(cache_file, data_arr)
+        os.replace(cache_tmp, cache)
+    except OSError:
+        # e.g. disk full part way through, don't leave the partial file next to the data
+        try:
+            os.remove(cache_tmp)
+        except OSError:
+            pass
+        return data_arr
+
+    # Map the fresh sidecar so only the pages the table and plot touch stay resident
+    return np.load(cache, mmap_mode='r')
+
+
+def display_grid(data, max_side=1024):
+    """The function splitting data into its x axis, y axis and grid, strided down to at most
+    max_side points per axis for display. Returns views, the full data is left as is
+    """
+    grid = data[1:, 1:]
+    step = max(1, int(np.ceil(max(grid.shape) / max_side)))
+
+    return data[0, 1::step], data[1::step, 0], grid[::step, ::step]
+
 
-def read_data(fname):
-    """The function that reads the file given in the -f arg.
-    It removes all rows with strings and returns two 1d numpy arrays
+def evenly_spaced(axis):
+    """The function checking that the axis values have a constant step, which imshow assumes"""
+    return axis.size < 3 or np.allclose(np.diff(axis), axis[1] - axis[0])
+
+
+@functools.lru_cache(maxsize=32)
+def contour_levels(z_min, z_max):
+    """The function returning the 15 colour band boundaries between z_min and z_max.
+    Cached since MaxNLocator works in pure Python and replot often asks for the same range
+    """
+    return MaxNLocator(nbins=15).tick_values(z_min, z_max)
+
+
+def table_window(center, length, half_width=50):
+    """The function returning the (lower, upper) bounds of the table slice around center.
+    The window is shifted to stay inside 0..length instead of wrapping at the edges
     """
-    data_arr = np.genfromtxt(fname, dtype='float64')
+    lower = min(max(center - half_width, 0), max(length - 2 * half_width, 0))
 
-    return data_arr
+    return lower, min(lower + 2 * half_width, length)
 
 
 class CustomTableModel(QtCore.QAbstractTableModel):
@@ -27,17 +149,27 @@ class CustomTableModel(QtCore.QAbstractTableModel):
     def __init__(self, data=None, tableindex=None):
         QtCore.QAbstractTableModel.__init__(self)
 
-        self.tabledata = data
-        self.tableindex = tableindex
-        if self.tabledata.shape[0] < 101:
-            pass
-        else:
-            self.lower_row = self.tableindex[1] - 50
-            self.upper_row = self.tableindex[1] + 50
-            self.lower_col = self.tableindex[0] - 50
-            self.upper_col = self.tableindex[0] + 50
-            self.tabledata = self.tabledata[self.lower_row:self.upper_row, self.lower_col:self.upper_col]
+        self.sourcedata = data
+        self.set_window(tableindex)
+
+    def set_window(self, tableindex):
+        """Method slicing the shown window out of the full array and formatting it"""
+        self.tableindex = tableindex or [0, 0]
+        self.lower_row, self.upper_row = table_window(self.tableindex[1], self.sourcedata.shape[0])
+        self.lower_col, self.upper_col = table_window(self.tableindex[0], self.sourcedata.shape[1])
+        self.tabledata = self.sourcedata[self.lower_row:self.upper_row, self.lower_col:self.upper_col]
+        # Header labels are built once per window and only indexed in headerData
+        self.col_labels = tuple(range(self.lower_col, self.upper_col))
+        self.row_labels = tuple(range(self.lower_row, self.upper_row))
         self.row_count, self.column_count = np.shape(self.tabledata)
+        # Format every cell once here instead of on each data() call
+        self.tabletext = np.char.mod('%.2f', self.tabledata)
+
+    def reslice(self, tableindex):
+        """Method moving the window to a new center, the view keeps this model and its header setup"""
+        self.beginResetModel()
+        self.set_window(tableindex)
+        self.endResetModel()
 
     def rowCount(self, parent=QtCore.QModelIndex()):
         return self.row_count
@@ -45,36 +177,63 @@ class CustomTableModel(QtCore.QAbstractTableModel):
     def columnCount(self, parent=QtCore.QModelIndex()):
         return self.column_count
 
+    def flags(self, index):
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
     def headerData(self, section, orientation, role):
         if role != QtCore.Qt.DisplayRole:
             return None
         if orientation == QtCore.Qt.Horizontal:
-            col_list = list(range(self.lower_col, self.upper_col))
-            return col_list[section]
+            return self.col_labels[section]
         if orientation == QtCore.Qt.Vertical:
-            row_list = list(range(self.lower_row, self.upper_row))
-            return row_list[section]
+            return self.row_labels[section]
         else:
             return "{}".format(section)
 
     def data(self, index, role=QtCore.Qt.DisplayRole):
+        # Ordered by how often the view asks for each role
         if role == QtCore.Qt.DisplayRole:
-            return str("{:.2f}".format(self.tabledata[index.row(), index.column()]))
-        elif role == QtCore.Qt.BackgroundRole:
-            return QtGui.QColor(QtCore.Qt.white)
-        elif role == QtCore.Qt.TextAlignmentRole:
-            return QtCore.Qt.AlignRight
+            return self.tabletext[index.row(), index.column()]
+        if role == QtCore.Qt.TextAlignmentRole:
+            return ALIGN_RIGHT
+        if role == QtCore.Qt.BackgroundRole:
+            return WHITE
 
         return None
 
 
+class DataLoader(QtCore.QThread):
+    """Class running read_data off the GUI thread, the array is sent with the loaded signal
+    and any error as a message with the failed signal."""
+    loaded = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, filename, rebuild=False, parent=None):
+        QtCore.QThread.__init__(self, parent)
+        self.filename = filename
+        self.rebuild = rebuild
+
+    def run(self):
+        try:
+            data = read_data(self.filename, self.rebuild)
+        except Exception as error:
+            # Anything raised here would otherwise only reach stderr and leave the status bar on 'Loading'
+            self.failed.emit('Could not load {}: {}'.format(self.filename, error))
+            return
+
+        self.loaded.emit(data)
+
+
 class Widget(QtWidgets.QWidget):
     """Class for laying out the table, plot and plot options widgets."""
+    status = QtCore.Signal(str)
+
     def __init__(self):
         """The method describing the layout of the table, plotting
         and plot options windows.
         """
         QtWidgets.QWidget.__init__(self)
+        self.loader = None
         try:
             self.tableindex
         except AttributeError:
@@ -89,15 +248,19 @@ class Widget(QtWidgets.QWidget):
         self.table_view = QtWidgets.QTableView()
         self.table_view.setModel(self.model)
 
-        # QTableView Headers
-        resize = QtWidgets.QHeaderView.ResizeToContents
+        # QTableView Headers, sized from the font and the formatted cells instead of measuring every cell
+        resize = QtWidgets.QHeaderView.Interactive
+        metrics = QtGui.QFontMetrics(self.table_view.font())
         self.horizontal_header = self.table_view.horizontalHeader()
         self.vertical_header = self.table_view.verticalHeader()
         self.horizontal_header.setSectionResizeMode(resize)
         self.vertical_header.setSectionResizeMode(resize)
+        self.fit_columns()
+        self.vertical_header.setDefaultSectionSize(metrics.height() + 6)
         self.horizontal_header.setStretchLastSection(False)
 
-        # Creating layout for plot options
+        # Creating layout for plot options, with updates held off until the layout is set
+        self.setUpdatesEnabled(False)
         self.options = QtWidgets.QVBoxLayout()
         self.options.setContentsMargins(0, 2, 0, 2)  # (int left, int top, int right, int bottom)
         self.options.setSpacing(2)
@@ -106,78 +269,18 @@ class Widget(QtWidgets.QWidget):
 
         self.options.addStretch(stretch=50)
 
-        self.label0 = QtWidgets.QLabel('x axis label: ')
-        self.label0.setAlignment(QtCore.Qt.AlignBottom)
-        self.label0.setSizePolicy(labelsize)
-        self.options.addWidget(self.label0)
-        self.x_axis_label = QtWidgets.QLineEdit('x axis label')
-        self.options.addWidget(self.x_axis_label)
-        self.options.addSpacing(5)
-
-        self.label1 = QtWidgets.QLabel('y axis label: ')
-        self.label1.setAlignment(QtCore.Qt.AlignBottom)
-        self.label1.setSizePolicy(labelsize)
-        self.options.addWidget(self.label1)
-        self.y_axis_label = QtWidgets.QLineEdit('y axis label')
-        self.options.addWidget(self.y_axis_label)
-        self.options.addSpacing(5)
-
-        self.label2 = QtWidgets.QLabel('axis label fontsize: ')
-        self.label2.setAlignment(QtCore.Qt.AlignBottom)
-        self.label2.setSizePolicy(labelsize)
-        self.options.addWidget(self.label2)
-        self.axis_label_fontsize = QtWidgets.QLineEdit('axis label fontsize')
-        self.options.addWidget(self.axis_label_fontsize)
-        self.options.addSpacing(5)
-
-        self.label3 = QtWidgets.QLabel('tickmarks fontsize: ')
-        self.label3.setAlignment(QtCore.Qt.AlignBottom)
-        self.label3.setSizePolicy(labelsize)
-        self.options.addWidget(self.label3)
-        self.tickmarks_fontsize = QtWidgets.QLineEdit('tickmarks fontsize')
-        self.options.addWidget(self.tickmarks_fontsize)
-        self.options.addSpacing(5)
-
-        self.label4 = QtWidgets.QLabel('shift y values: ')
-        self.label4.setAlignment(QtCore.Qt.AlignBottom)
-        self.label4.setSizePolicy(labelsize)
-        self.options.addWidget(self.label4)
-        self.shift_y_values = QtWidgets.QLineEdit('shift y values')
-        self.options.addWidget(self.shift_y_values)
-        self.options.addSpacing(5)
-
-        self.label5 = QtWidgets.QLabel('multiply y values: ')
-        self.label5.setAlignment(QtCore.Qt.AlignBottom)
-        self.label5.setSizePolicy(labelsize)
-        self.options.addWidget(self.label5)
-        self.multiply_y_values = QtWidgets.QLineEdit('multiply y values')
-        self.options.addWidget(self.multiply_y_values)
-        self.options.addSpacing(5)
-
-        self.button = QtWidgets.QPushButton('Replot', self)
-        self.options.addWidget(self.button)
-        self.button.clicked.connect(self.replot)
+        self.add_options(PLOT_OPTIONS, labelsize)
+
+        self.replot_button = QtWidgets.QPushButton('Replot', self)
+        self.options.addWidget(self.replot_button)
+        self.replot_button.clicked.connect(self.replot)
         self.options.addSpacing(10)
 
-        self.label6 = QtWidgets.QLabel('Center column: ')
-        self.label6.setAlignment(QtCore.Qt.AlignBottom)
-        self.label6.setSizePolicy(labelsize)
-        self.options.addWidget(self.label6)
-        self.centercol = QtWidgets.QLineEdit('Center column')
-        self.options.addWidget(self.centercol)
-        self.options.addSpacing(5)
-
-        self.label7 = QtWidgets.QLabel('Center row: ')
-        self.label7.setAlignment(QtCore.Qt.AlignBottom)
-        self.label7.setSizePolicy(labelsize)
-        self.options.addWidget(self.label7)
-        self.centerrow = QtWidgets.QLineEdit('Center row')
-        self.options.addWidget(self.centerrow)
-        self.options.addSpacing(5)
-
-        self.button = QtWidgets.QPushButton('Recenter table', self)
-        self.options.addWidget(self.button)
-        self.button.clicked.connect(self.table_recenter)
+        self.add_options(TABLE_OPTIONS, labelsize)
+
+        self.recenter_button = QtWidgets.QPushButton('Recenter table', self)
+        self.options.addWidget(self.recenter_button)
+        self.recenter_button.clicked.connect(self.table_recenter)
         self.options.addSpacing(10)
 
         self.file_button = QtWidgets.QPushButton('CSV Import', self)
@@ -204,20 +307,80 @@ class Widget(QtWidgets.QWidget):
 
         # Set the layout to the QWidget
         self.setLayout(self.main_layout)
+        self.setUpdatesEnabled(True)
+        self.updateGeometry()
+
+    def add_options(self, options, labelsize):
+        """Method adding a label and line edit to the options layout for each (attribute, text) pair"""
+        for name, text in options:
+            label = QtWidgets.QLabel(text + ': ')
+            label.setAlignment(QtCore.Qt.AlignBottom)
+            label.setSizePolicy(labelsize)
+            self.options.addWidget(label)
+            line_edit = QtWidgets.QLineEdit(text)
+            setattr(self, name, line_edit)
+            self.options.addWidget(line_edit)
+            self.options.addSpacing(5)
+
+        return None
 
     def plot(self, data):
         """Creating matplotlib layout"""
-        levels = MaxNLocator(nbins=15).tick_values(data[1:, 1:].min(), data[1:, 1:].max())
+        levels = contour_levels(self.z_min, self.z_max)
         self.fig = Figure(figsize=(7, 7), dpi=100, facecolor=(1, 1, 1), edgecolor=(0, 0, 0))
         self.canvas = FigureCanvas(self.fig)
         self.ax = self.fig.add_subplot(111)
-        self.ax.contourf(data[1:, 0], data[0, 1:], data[1:, 1:], levels=levels, cmap='inferno')
+        self.draw_grid(data, levels)
         self.toolbar = NavigationToolbar(self.canvas, self)
         self.plot_layout = QtWidgets.QVBoxLayout()
         self.plot_layout.addWidget(self.toolbar)
         self.plot_layout.addWidget(self.canvas)
         self.canvas.draw()
 
+    def draw_grid(self, data, levels):
+        """Method drawing the heatmap with the same 15 colour bands contourf drew as polygons.
+        Evenly spaced axes get one raster image, uneven ones (e.g. log spaced time delays)
+        a pcolormesh so every cell sits at its real coordinates
+        """
+        x_axis, y_axis, grid = display_grid(data)
+        norm = BoundaryNorm(levels, 256)
+        if evenly_spaced(data[0, 1:]) and evenly_spaced(data[1:, 0]):
+            extent = [data[0, 1], data[0, -1], data[1, 0], data[-1, 0]]
+            self.image = self.ax.imshow(grid, origin='lower', extent=extent, aspect='auto',
+                                        interpolation='nearest', cmap='inferno', norm=norm)
+        else:
+            self.image = self.ax.pcolormesh(x_axis, y_axis, grid, shading='auto', cmap='inferno', norm=norm)
+
+        return None
+
+    def grid_limits(self):
+        """Method returning the [x0, x1, y0, y1] view that shows the whole heatmap"""
+        if isinstance(self.image, AxesImage):
+            return list(self.image.get_extent())
+        box = self.image.get_datalim(self.ax.transData)
+
+        return [box.x0, box.x1, box.y0, box.y1]
+
+    def update_plot(self, data):
+        """Method pointing the heatmap at new data, the figure, canvas and toolbar are kept"""
+        levels = contour_levels(self.z_min, self.z_max)
+        if isinstance(self.image, AxesImage) and evenly_spaced(data[0, 1:]) and evenly_spaced(data[1:, 0]):
+            self.image.set_array(display_grid(data)[2])
+            self.image.set_norm(BoundaryNorm(levels, 256))
+            self.image.set_extent([data[0, 1], data[0, -1], data[1, 0], data[-1, 0]])
+        else:
+            # A mesh's coordinates and shape are fixed, so it is rebuilt for the new axes
+            self.image.remove()
+            self.draw_grid(data, levels)
+        extent = self.grid_limits()
+        # The heatmap is the only artist, so its extent is the full view; skip relim/autoscale
+        if not np.allclose(self.ax.get_xlim() + self.ax.get_ylim(), extent):
+            self.ax.set_xlim(extent[:2])
+            self.ax.set_ylim(extent[2:])
+        self.canvas.draw_idle()
+
+        return None
+
     def replot(self):
         """The method that takes user inputs for plot options and calls for a replot"""
         x_axis_label = self.x_axis_label.text()
@@ -226,50 +389,160 @@ class Widget(QtWidgets.QWidget):
         tickmarks_fontsize = self.tickmarks_fontsize.text()
         shift_y_values = self.shift_y_values.text()
         multiply_y_values = self.multiply_y_values.text()
-        y_shift = float(shift_y_values)
-        y_factor = float(multiply_y_values)
-        for i in range(self.num_files):
-            data = self.data[i]
-            data[:, 1] /= data[:, 1].max()
-            self.plot.set_data(data[:, 0], y_factor * (data[:, 1] + y_shift))
-        self.ax.set_xlabel(x_axis_label, fontsize=axis_label_fontsize)
-        self.ax.set_ylabel(y_axis_label, fontsize=axis_label_fontsize)
-        self.ax.tick_params(axis='both', which='major', labelsize=tickmarks_fontsize)
-        self.canvas.draw()
+        params = (x_axis_label, y_axis_label, axis_label_fontsize, tickmarks_fontsize,
+                  shift_y_values, multiply_y_values)
+        if params == self.last_params:
+            return None
+        last = self.last_params or (None,) * len(params)
+
+        if params[4:] != last[4:]:
+            y_shift = float(shift_y_values)
+            y_factor = float(multiply_y_values)
+            # Shift and scale the normalized grid into the reused buffer, self.data stays untouched
+            np.add(self.z_norm, y_shift, out=self.z_buf)
+            self.z_buf *= y_factor
+            # The bands stay at the unshifted normalized range, so shift and scale show up as colour changes
+            levels = contour_levels(self.z_min / self.z_max, 1.0)
+            self.image.set_array(self.z_buf)
+            self.image.set_norm(BoundaryNorm(levels, 256))
+        if params[:4] != last[:4]:
+            label_size = float(axis_label_fontsize)
+            tick_size = float(tickmarks_fontsize)
+            self.ax.set_xlabel(x_axis_label, fontsize=label_size)
+            self.ax.set_ylabel(y_axis_label, fontsize=label_size)
+            self.ax.tick_params(axis='both', which='major', labelsize=tick_size)
+            self.canvas.draw_idle()
+        else:
+            self.blit_image()
+        self.last_params = params
+
+    def blit_image(self):
+        """Method repainting only the axes area when nothing but the image data changed"""
+        # The patch clears cells left transparent by NaNs, the spines are drawn back over the image edge
+        for artist in (self.ax.patch, self.image, *self.ax.spines.values()):
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+
+        return None
+
+    def fit_columns(self):
+        """Method setting the column width from the longest formatted cell or column label in the shown window"""
+        metrics = QtGui.QFontMetrics(self.table_view.font())
+        longest = max(int(np.char.str_len(self.model.tabletext).max(initial=0)), len(str(self.model.upper_col - 1)))
+        self.horizontal_header.setDefaultSectionSize(longest * metrics.horizontalAdvance('0') + 10)
+
+        return None
 
     def table_recenter(self):
         """Method that centers the table on a new index"""
         col = self.centercol.text()
         row = self.centerrow.text()
         self.tableindex = [int(col), int(row)]
-        self.model = CustomTableModel(self.data, self.tableindex)
-        self.table_view.setModel(self.model)
+        self.model.reslice(self.tableindex)
+        self.fit_columns()
+
+        return None
+
+    def normalize_data(self):
+        """Method storing the max normalized grid and the scratch buffer used by replot"""
+        grid = self.data[1:, 1:]
+        # The only full-grid reductions per file, reused by plot, update_plot and replot
+        self.z_min, self.z_max = grid.min(), grid.max()
+        self.z_norm = display_grid(self.data)[2] / self.z_max
+        self.z_buf = np.empty_like(self.z_norm)
+        # New data, so the next replot has to redraw everything
+        self.last_params = None
 
         return None
 
     def open_csv(self):
         """Method opening first csv and saving data and headers"""
         filename, *_ = QtWidgets.QFileDialog.getOpenFileName(self, self.tr('Open txt'), self.tr("~/Desktop/"),
-                                                             self.tr('Files (*.txt)'))
+                                                             self.tr('Files (*.txt *.npy)'))
+        self.filename = filename
         self.data = read_data(filename)
         self.shape = np.shape(self.data)
+        self.normalize_data()
 
         return None
 
     def new_csv(self):
         """Method opening new csv and saving data"""
         filename, *_ = QtWidgets.QFileDialog.getOpenFileName(self, self.tr('Open txt'), self.tr("~/Desktop/"),
-                                                             self.tr('Files (*.txt)'))
-        self.data = read_data(filename)
+                                                             self.tr('Files (*.txt *.npy)'))
+        if filename:
+            self.load_csv(filename)
+
+        return None
+
+    def rebuild_cache(self):
+        """Method reparsing the current file, for when it was edited without its timestamp changing"""
+        self.load_csv(self.filename, rebuild=True)
+
+        return None
+
+    def load_csv(self, filename, rebuild=False):
+        """Method reading a file in a DataLoader thread so the window stays responsive.
+        Only one load runs at a time, both the import button and Rebuild cache wait for it
+        """
+        if self.loader is not None and self.loader.isRunning():
+            self.status.emit('Still loading {}'.format(self.loader.filename))
+            return None
+
+        self.filename = filename
+        self.file_button.setEnabled(False)
+        self.status.emit('Loading {}'.format(filename))
+        self.loader = DataLoader(filename, rebuild, self)
+        self.loader.loaded.connect(self.data_loaded)
+        self.loader.failed.connect(self.load_failed)
+        self.loader.finished.connect(self.loader_finished)
+        self.loader.finished.connect(self.loader.deleteLater)
+        self.loader.start()
+
+        return None
+
+    @QtCore.Slot()
+    def loader_finished(self):
+        """Method re-enabling the import button once the current DataLoader is done"""
+        if self.sender() is self.loader:
+            self.file_button.setEnabled(True)
+            # The thread object is freed by deleteLater, drop the reference before that happens
+            self.loader = None
+
+        return None
+
+    def wait_for_loader(self):
+        """Method blocking until a running DataLoader is done, so the widget never outlives its thread"""
+        if self.loader is not None and self.loader.isRunning():
+            self.loader.wait()
+
+        return None
+
+    @QtCore.Slot(str)
+    def load_failed(self, message):
+        """Method showing why the current DataLoader could not read its file"""
+        if self.sender() is self.loader:
+            self.status.emit(message)
+
+        return None
+
+    @QtCore.Slot(object)
+    def data_loaded(self, data):
+        """Method putting the data read by the DataLoader into the table and plot"""
+        # Results from a loader that has since been replaced are stale
+        if self.sender() is not self.loader:
+            return None
+
+        self.data = data
         self.shape = np.shape(self.data)
+        self.normalize_data()
 
-        self.model = CustomTableModel(self.data, None)
+        self.model = CustomTableModel(self.data, self.tableindex)
         self.table_view.setModel(self.model)
+        self.fit_columns()
 
-        self.plot.set_data(self.data[0, :], self.data[:, 0], self.data[1:, 1:])
-        self.ax.relim()
-        self.ax.autoscale_view(True, True, True)
-        self.canvas.draw()
+        self.update_plot(self.data)
+        self.status.emit('Data loaded and plotted')
         return None
 
 
@@ -285,6 +558,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.menu = self.menuBar()
         self.file_menu = self.menu.addMenu('File')
 
+        rebuild_action = QtWidgets.QAction('Rebuild cache', self)
+        rebuild_action.triggered.connect(widget.rebuild_cache)
+        self.file_menu.addAction(rebuild_action)
+
         exit_action = QtWidgets.QAction('Exit', self)
         exit_action.setShortcut(QtGui.QKeySequence.Quit)
         exit_action.triggered.connect(self.close)
@@ -292,6 +569,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.status = self.statusBar()
         self.status.showMessage('Data loaded and plotted')
+        widget.status.connect(self.status.showMessage)
+
+    def closeEvent(self, event):
+        """Waits for a file still loading, Qt aborts if a running QThread is destroyed with the widget"""
+        self.centralWidget().wait_for_loader()
+        QtWidgets.QMainWindow.closeEvent(self, event)
 
 
 if __name__ == "__main__":